@@ -0,0 +1,92 @@
+"""CUDA version of the checkerboard Metropolis sweep, used by ``Driver(backend='cuda')``.
+
+Each GPU thread handles one site of the lattice. A sweep launches the kernel
+twice, once for every parity of ``i + j``, so that the sites updated
+concurrently are never nearest neighbours. The energy and spin proposal
+functions are compiled from the same Python source as the CPU kernels in
+``mcsim._kernels``.
+"""
+import math
+
+import numpy as np
+from numba import cuda, float64
+from numba.cuda.random import create_xoroshiro128p_states, xoroshiro128p_uniform_float32
+
+from mcsim import _kernels
+
+THREADS_PER_BLOCK = (16, 16)
+BLOCK_SIZE = THREADS_PER_BLOCK[0] * THREADS_PER_BLOCK[1]
+
+local_energy = cuda.jit(device=True)(_kernels.local_energy.py_func)
+propose_spin = cuda.jit(device=True)(_kernels.propose_spin.py_func)
+
+
+@cuda.jit
+def mc_step_parity(arr, nx, ny, rng_states, B, u, K, J, D, alpha, parity, track_energy, dE, k):
+    """Metropolis update (T=0) of every site (i,j) with ``(i + j) % 2 == parity``.
+
+    If ``track_energy`` is True, the energy differences of the accepted updates
+    are summed in shared memory within each block, and each block adds its sum
+    to ``dE[k]`` with a single atomic operation.
+    """
+    # threadIdx.x runs along j, the contiguous axis of arr, so the loads of a warp are coalesced.
+    j, i = cuda.grid(2)
+    accepted_dE = 0.0
+
+    # No early return: all threads of the block must reach cuda.syncthreads() below.
+    if i < nx and j < ny and (i + j) % 2 == parity:
+        thread_id = i * ny + j
+        rx = xoroshiro128p_uniform_float32(rng_states, thread_id)
+        ry = xoroshiro128p_uniform_float32(rng_states, thread_id)
+        rz = xoroshiro128p_uniform_float32(rng_states, thread_id)
+
+        E_0 = local_energy(arr, nx, ny, i, j, B, u, K, J, D)
+        s0x, s0y, s0z = arr[0, i, j], arr[1, i, j], arr[2, i, j]
+        arr[0, i, j], arr[1, i, j], arr[2, i, j] = propose_spin(s0x, s0y, s0z, rx, ry, rz, alpha)
+        delta_E = local_energy(arr, nx, ny, i, j, B, u, K, J, D) - E_0
+        if delta_E >= 0:
+            arr[0, i, j], arr[1, i, j], arr[2, i, j] = s0x, s0y, s0z
+        else:
+            accepted_dE = delta_E
+
+    if track_energy:
+        partial = cuda.shared.array(BLOCK_SIZE, float64)
+        tid = cuda.threadIdx.y * cuda.blockDim.x + cuda.threadIdx.x
+        partial[tid] = accepted_dE
+        cuda.syncthreads()
+
+        stride = BLOCK_SIZE // 2
+        while stride > 0:
+            if tid < stride:
+                partial[tid] += partial[tid + stride]
+            cuda.syncthreads()
+            stride //= 2
+
+        if tid == 0:
+            cuda.atomic.add(dE, k, partial[0])
+
+
+def mc_sweeps(arr, nx, ny, B, u, K, J, D, n_sweeps, alpha, seed, track_energy=True):
+    """Run ``n_sweeps`` checkerboard sweeps on the GPU and update ``arr`` in place.
+
+    Returns the change in total energy after each sweep (cumulative). If
+    ``track_energy`` is False the energy differences are not accumulated on
+    the GPU, and the returned changes are all zero.
+    """
+    blocks = (math.ceil(ny / THREADS_PER_BLOCK[0]), math.ceil(nx / THREADS_PER_BLOCK[1]))
+
+    # Scalars in the dtype of the spins, so float32 lattices are not promoted to float64.
+    K, J, D, alpha = (arr.dtype.type(x) for x in (K, J, D, alpha))
+
+    d_arr = cuda.to_device(arr)
+    d_B, d_u = cuda.to_device(B), cuda.to_device(u)
+    d_dE = cuda.to_device(np.zeros(n_sweeps))
+    rng_states = create_xoroshiro128p_states(nx * ny, seed=seed)
+
+    for k in range(n_sweeps):
+        for parity in range(2):
+            mc_step_parity[blocks, THREADS_PER_BLOCK](d_arr, nx, ny, rng_states, d_B, d_u,
+                                                      K, J, D, alpha, parity, track_energy, d_dE, k)
+
+    d_arr.copy_to_host(arr)
+    return np.cumsum(d_dE.copy_to_host())
@@ -0,0 +1,128 @@
+"""Numba-compiled kernels for the Metropolis Monte Carlo algorithm.
+
+These functions work on raw numpy arrays and scalars only, so they can be
+compiled in nopython mode. The spins are passed as ``arr``, the ``(3, nx, ny)``
+array of component planes ``mcsim.Spins.components``, together with the
+lattice dimensions ``nx`` and ``ny`` as plain integers. They are used internally
+by ``mcsim.Driver`` and ``mcsim.System``, and the physics is exactly the same as
+in the methods of ``mcsim.System``.
+
+All kernels are compiled eagerly for float32 and float64 spins with explicit
+signatures, and cached on disk, so only the first import of ``mcsim`` pays
+the compilation time. The constants K, J and D are always float64, so the
+energies are accumulated in double precision even for float32 spins.
+"""
+import math
+
+from numba import njit, prange
+
+
+def _signatures(signature):
+    """Signature template ``signature`` with ``{f}`` as float32 and as float64."""
+    return [signature.format(f=f) for f in ("float32", "float64")]
+
+
+@njit(_signatures("float64({f}[:, :, :], int64, int64, int64, int64, {f}[:], {f}[:], float64, float64, float64)"),
+      cache=True, fastmath=True, boundscheck=False)
+def local_energy(arr, nx, ny, i, j, B, u, K, J, D):
+    """Energy of all the terms involving the spin at (i,j).
+
+    Zeeman and anisotropy of s_i,j plus exchange and DMI of the (up to 4)
+    bonds between s_i,j and its nearest neighbours. ``u`` must be normalised.
+    """
+    sx, sy, sz = arr[0, i, j], arr[1, i, j], arr[2, i, j]
+
+    s_u = sx*u[0] + sy*u[1] + sz*u[2]
+    E = -(sx*B[0] + sy*B[1] + sz*B[2]) - K * s_u * s_u
+
+    if j + 1 < ny:
+        tx, ty, tz = arr[0, i, j+1], arr[1, i, j+1], arr[2, i, j+1]
+        E += -J * (sx*tx + sy*ty + sz*tz) + D * (sy*tz - sz*ty)
+    if j > 0:
+        tx, ty, tz = arr[0, i, j-1], arr[1, i, j-1], arr[2, i, j-1]
+        E += -J * (sx*tx + sy*ty + sz*tz) + D * (ty*sz - tz*sy)
+    if i + 1 < nx:
+        tx, ty, tz = arr[0, i+1, j], arr[1, i+1, j], arr[2, i+1, j]
+        E += -J * (sx*tx + sy*ty + sz*tz) + D * (sz*tx - sx*tz)
+    if i > 0:
+        tx, ty, tz = arr[0, i-1, j], arr[1, i-1, j], arr[2, i-1, j]
+        E += -J * (sx*tx + sy*ty + sz*tz) + D * (tz*sx - tx*sz)
+
+    return E
+
+
+@njit(_signatures("UniTuple({f}, 3)({f}, {f}, {f}, {f}, {f}, {f}, {f})"),
+      cache=True, fastmath=True, boundscheck=False)
+def propose_spin(sx, sy, sz, rx, ry, rz, alpha):
+    """Randomly perturbed spin (sx, sy, sz), normalised to 1.
+
+    Scalar version of ``mcsim.driver.random_spin``. ``rx``, ``ry`` and ``rz``
+    are uniform random numbers in [0, 1), and the normalisation is a single
+    reciprocal square root, without allocating any array.
+    """
+    sx = sx + (2 * rx - 1) * alpha
+    sy = sy + (2 * ry - 1) * alpha
+    sz = sz + (2 * rz - 1) * alpha
+    inv_norm = 1.0 / math.sqrt(sx*sx + sy*sy + sz*sz)
+    return sx * inv_norm, sy * inv_norm, sz * inv_norm
+
+
+@njit(_signatures("float64({f}[:, :, :], int64, int64, {f}[:, :, :], {f}[:], {f}[:], float64, float64, float64, {f})"),
+      cache=True, fastmath=True, boundscheck=False, parallel=True)
+def mc_sweep(arr, nx, ny, r, B, u, K, J, D, alpha):
+    """Run one checkerboard sweep of the Metropolis algorithm (T=0) on ``arr`` in place.
+
+    The sweep visits all sites in two phases: first the sites with even
+    ``i + j`` and then the ones with odd ``i + j``. Sites of the same parity
+    are not nearest neighbours, so within a phase their updates are
+    independent and the rows are distributed over threads with ``prange``.
+
+    ``r`` has the same shape as ``arr`` and holds the uniform random numbers
+    in [0, 1) for the proposal of every site, drawn in one batch by the caller.
+
+    Returns the change in total energy, accumulated from the local energy
+    differences of the accepted updates.
+    """
+    E = 0.0
+    for parity in range(2):
+        dE = 0.0
+        for i in prange(nx):
+            for j in range((i + parity) % 2, ny, 2):
+                E_0 = local_energy(arr, nx, ny, i, j, B, u, K, J, D)
+                s0x, s0y, s0z = arr[0, i, j], arr[1, i, j], arr[2, i, j]
+                arr[0, i, j], arr[1, i, j], arr[2, i, j] = propose_spin(
+                    s0x, s0y, s0z, r[0, i, j], r[1, i, j], r[2, i, j], alpha)
+                delta_E = local_energy(arr, nx, ny, i, j, B, u, K, J, D) - E_0
+                if delta_E >= 0:
+                    arr[0, i, j], arr[1, i, j], arr[2, i, j] = s0x, s0y, s0z
+                else:
+                    dE += delta_E
+        E += dE
+    return E
+
+
+@njit(_signatures("float64({f}[:, :, :], int64, int64, {f}[:], {f}[:], float64, float64, float64)"),
+      cache=True, fastmath=True, boundscheck=False, parallel=True)
+def total_energy(arr, nx, ny, B, u, K, J, D):
+    """Total energy of the lattice in a single pass over ``arr``.
+
+    Zeeman and anisotropy are added for every spin, and exchange and DMI for
+    the bonds to the neighbours at (i,j+1) and (i+1,j), so that each bond is
+    counted once. ``u`` must be normalised.
+    """
+    E = 0.0
+    for i in prange(nx):
+        for j in range(ny):
+            sx, sy, sz = arr[0, i, j], arr[1, i, j], arr[2, i, j]
+
+            s_u = sx*u[0] + sy*u[1] + sz*u[2]
+            E += -(sx*B[0] + sy*B[1] + sz*B[2]) - K * s_u * s_u
+
+            if j + 1 < ny:
+                tx, ty, tz = arr[0, i, j+1], arr[1, i, j+1], arr[2, i, j+1]
+                E += -J * (sx*tx + sy*ty + sz*tz) + D * (sy*tz - sz*ty)
+            if i + 1 < nx:
+                tx, ty, tz = arr[0, i+1, j], arr[1, i+1, j], arr[2, i+1, j]
+                E += -J * (sx*tx + sy*ty + sz*tz) + D * (sz*tx - sx*tz)
+
+    return E
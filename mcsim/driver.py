@@ -1,8 +1,13 @@
 import numpy as np
 
+from mcsim import _kernels
+
 def random_spin(s0, alpha=0.1):
     """Generate a new random spin based on the original one.
 
+    This is the numpy version for use outside of the driver. ``Driver.drive``
+    uses the scalar ``mcsim._kernels.propose_spin`` inside its compiled loop.
+
     Parameters
     ----------
     s0: np.ndarray
@@ -28,57 +33,97 @@ def random_spin(s0, alpha=0.1):
 class Driver:
     """Driver class.
 
-    Driver class does not take any input parameters at initialisation.
+    Parameters
+    ----------
+    seed: int, optional
+
+        Seed of the random number generator (``np.random.default_rng``) used for
+        the spin proposals. Two drivers with the same seed produce the same
+        evolution of the same system. Defaults to None (unpredictable seed).
+
+    backend: str, optional
+
+        Where the Monte Carlo sweeps run: ``'cpu'`` (multithreaded Numba kernel) or
+        ``'cuda'`` (one GPU thread per lattice site, requires a CUDA-capable GPU).
+        The GPU pays off for large lattices, roughly 256x256 spins and more.
+        Defaults to ``'cpu'``.
 
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, seed=None, backend='cpu'):
+        if backend not in ('cpu', 'cuda'):
+            raise ValueError(f"backend must be 'cpu' or 'cuda', not {backend!r}.")
+
+        self.rng = np.random.default_rng(seed)
+        self.backend = backend
 
-    def drive(self, system, n, alpha=0.1):
+    def drive(self, system, n, alpha=0.1, return_energy_trace=False):
         """Executes the Metropolis Monte Carlo algorithm.
         The purpose is to simulate the system's behaviour and bring it closer to the equilibrium by 
         probabilistically accepting or rejecting proposed spin updates based on their impact on 
         the system's energy.
     
-        For each iteration, a random spin in the system is chosen, and its value is slightly
-        perturbed. The system's energy is computed before and after the perturbation. The 
-        perturbation is accepted if it lowers the system's energy otherwise, it is rejected.
+        For each iteration, a spin in the system is chosen, and its value is slightly
+        perturbed. Only the energy terms involving that spin are computed before and after
+        the perturbation, since the rest of the lattice is unchanged.
+        The perturbation is accepted if it lowers the system's energy otherwise, it is rejected.
         (We are not implementing the probabilistic acceptation with Boltzmann factor, as T=0)
 
+        The spins are visited in checkerboard sweeps over the whole lattice: first all the
+        sites with even i+j, then all the sites with odd i+j. Spins of the same colour are not
+        nearest neighbours, so they are updated in parallel in a compiled kernel
+        (``mcsim._kernels.mc_sweep``). The ``n`` iterations are rounded up to a whole number
+        of sweeps of nx*ny iterations. The random numbers of each sweep are drawn in a
+        single batch from ``self.rng`` before calling the kernel. With the ``'cuda'`` backend,
+        the sweeps run on the GPU (``mcsim._cuda``) with a random number generator per thread
+        seeded from ``self.rng``.
+
         Parameters
         ----------
         system 
-            An instance of the system whose spins are to be updated. This object has a 'energy' 
-            method to compute its energy and an 's' attribute representing its spins (object)
+            An instance of the system whose spins are to be updated. Its parameters (B, K, u, J, D)
+            and its 's' attribute representing its spins are passed to the kernel (object)
         
          
             Number of iterations the Metropolis Monte Carlo algorithm should be run for (int)
 
         alpha 
-            A parameter passed to the 'random_spin' function which determines the magnitude
+            A parameter passed to the spin proposal which determines the magnitude
             of the spin perturbation. Larger 'alpha' results in larger spin perturbations.
             Defaults to 0.1 (float, optional)
 
+        return_energy_trace
+            If True, the total energy of the system after each sweep is returned. The energy is
+            computed once before the first sweep and then updated with the energy differences
+            of the accepted changes. Defaults to False (bool, optional)
+
         Returns
         -------
 
-        The method updates the spins in-place and does not return any value. The implementation 
-        provided accepts changes that lower the energy but does not include probabilistic acceptance 
-        based on the Boltzmann factor.
+        The method updates the spins in-place. If 'return_energy_trace' is True, it returns a
+        numpy.ndarray with the total energy after each sweep, otherwise it does not return any
+        value. The implementation provided accepts changes that lower the energy but does not
+        include probabilistic acceptance based on the Boltzmann factor.
         """
 
-        for _ in range(n):
-            E_0=system.energy() 
-            i = np.random.randint(0, system.s.n[0])
-            j = np.random.randint(0, system.s.n[1])
-            s0 = system.s.array[i,j].copy() #We create the random spin
-            s_0_changed = random_spin(s0, alpha)
-            system.s.array[i,j] = s_0_changed #We change the value of that random spin
-            E_1 = system.energy()
-            delta_E = E_1 - E_0
-            if delta_E < 0:
-                E_0 = E_1 #We accept the change
-            else:
-                system.s.array[i,j]=s0
-
+        nx, ny = system.s.nx, system.s.ny
+        n_sweeps = -(-n // (nx * ny))  # Rounded up
+        B, u, K, J, D = system._kernel_params()
+        E = system.energy() if return_energy_trace else 0.0
+
+        if self.backend == 'cuda':
+            from mcsim import _cuda  # Imported here, so numba.cuda is only needed for this backend
+
+            seed = self.rng.integers(2**63)
+            trace = E + _cuda.mc_sweeps(system.s.components, nx, ny, B, u, K, J, D, n_sweeps, alpha,
+                                        seed, track_energy=return_energy_trace)
+        else:
+            r = np.empty_like(system.s.components)
+            trace = np.empty(n_sweeps)
+            for k in range(n_sweeps):
+                self.rng.random(dtype=r.dtype, out=r)
+                E += _kernels.mc_sweep(system.s.components, nx, ny, r, B, u, K, J, D, float(alpha))
+                trace[k] = E
+
+        if return_energy_trace:
+            return trace
@@ -1,14 +1,10 @@
 import numbers
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-import matplotlib.cm as cm
-import matplotlib.patches as patches
 import numpy as np
 
 
 class HoneycombSpins:
-    def __init__(self, n, value=(0,0,1)):
-        """Exactly same as 2D lattice
+    def __init__(self, n, value=(0,0,1), dtype=np.float32):
+        """Exactly same as 2D lattice (including the ``dtype`` argument)
         But when need to take into account that there are 2 atoms (A, B)
         in each unit cell, so we need to distinguish two spins.
         """
@@ -25,7 +21,8 @@ class HoneycombSpins:
         
         
         self.n = n
-        self.array = np.empty((self.n[0], self.n[1], 2, 3), dtype=np.float64)
+        self.array = np.empty((self.n[0], self.n[1], 2, 3), dtype=dtype)
+        self._mesh = None  # Lattice coordinates for plot_honeycomb, computed on the first call
         self.array[..., :] = value
 
         """
@@ -36,13 +33,21 @@ class HoneycombSpins:
 
     def plot_honeycomb(self):
         """Plots the 3 components of the spins on a honeycomb lattice"""
+        import matplotlib.pyplot as plt  # Imported here, so mcsim can be imported without loading matplotlib
 
         fig, ax = plt.subplots()
-        a = 1 #Lattice constant
-        delta_y = a * np.sqrt(3)/2
 
-        nx_A, ny_A = np.meshgrid(range(self.n[0]), range(self.n[1]))
-        nx_B, ny_B = nx_A + 0.5, ny_A + delta_y  #HoneyComb basis 
+        if self._mesh is None:
+            a = 1 #Lattice constant
+            delta_y = np.float32(a * np.sqrt(3)/2)
+
+            # 'ij' indexing gives (nx, ny) arrays, matching the shape of the spin components
+            i = np.arange(self.n[0], dtype=np.float32)
+            j = np.arange(self.n[1], dtype=np.float32)
+            nx_A, ny_A = np.meshgrid(i, j, indexing='ij')
+            nx_B, ny_B = nx_A + 0.5, ny_A + delta_y  #HoneyComb basis
+            self._mesh = nx_A, ny_A, nx_B, ny_B
+        nx_A, ny_A, nx_B, ny_B = self._mesh
 
 
 
@@ -62,9 +67,9 @@ class HoneycombSpins:
 
     def randomise(self):
         """Randomise the spins on the lattice and normalize them."""
-        self.array = 2 * np.random.random((*self.n, 2, 3)) - 1
-        norms = np.sqrt(np.sum(self.array ** 2, axis=-1, keepdims=True))
-        self.array /= norms
+        self.array = (2 * np.random.random((*self.n, 2, 3)) - 1).astype(self.array.dtype)
+        norms = np.sqrt(np.einsum('ijak,ijak->ija', self.array, self.array))[..., np.newaxis]
+        np.divide(self.array, norms, out=self.array)
 
     def mean(self):
         """Calculate the mean spin value (Same as in Spins class)"""
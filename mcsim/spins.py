@@ -1,7 +1,4 @@
 import numbers
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-import matplotlib.cm as cm
 import numpy as np
 import mcsim
 
@@ -12,10 +9,15 @@ class Spins:
     """Field of spins on a two-dimensional lattice.
 
     Each spin is a three-dimensional vector s = (sx, sy, sz). Underlying data
-    stucture (``self.array``) is a numpy array (``np.ndarray``) with shape
-    ``(nx, ny, 3)``, where ``nx`` and ``ny`` are the number of spins in the x
-    and y directions, respectively, and 3 to hold all three vector components of
-    the spin.
+    stucture (``self.components``) is a numpy array (``np.ndarray``) with shape
+    ``(3, nx, ny)``, where ``nx`` and ``ny`` are the number of spins in the x
+    and y directions, respectively, and 3 to hold the planes of the three vector
+    components of the spins (``self.sx``, ``self.sy`` and ``self.sz``). Storing
+    each component contiguously lets the energy calculations work on whole planes.
+
+    ``self.array`` is a view of the same data with shape ``(nx, ny, 3)``, so
+    ``self.array[i, j]`` is the spin at (i,j) and writing to it modifies the
+    lattice.
 
     Parameters
     ----------
@@ -31,9 +33,15 @@ class Spins:
         lattice. All elements of ``value`` must be real numbers. Defaults to
         ``(0, 0, 1)``.
 
+    dtype: numpy.dtype
+
+        Floating point type of the spins. Defaults to ``np.float32``, which
+        halves the memory traffic of the energy calculations compared to
+        ``np.float64``. Use ``np.float64`` if double precision is needed.
+
     """
 
-    def __init__(self, n, value=(0, 0, 1)):
+    def __init__(self, n, value=(0, 0, 1), dtype=np.float32):
         # Checks on input parameters.
         if len(n) != 2:
             raise ValueError(f"Length of iterable n must be 2, not {len(n)=}.")
@@ -45,14 +53,54 @@ class Spins:
         if any(not isinstance(i, numbers.Real) for i in value):
             raise ValueError("Elements of value must be real numbers.")
 
-        self.n = n
-        self.array = np.empty((*self.n, 3), dtype=np.float64)
+        self.nx, self.ny = int(n[0]), int(n[1])
+        self.components = np.empty((3, self.nx, self.ny), dtype=dtype)
+        self._mesh = None  # Lattice coordinates for plot, computed on the first call
         self.array[..., :] = value
 
         if not np.isclose(value[0] ** 2 + value[1] ** 2 + value[2] ** 2, 1):
             # we ensure all spins' magnitudes are normalised to 1.
             self.normalise()
 
+    @property
+    def n(self):
+        """Dimensions of the lattice ``(nx, ny)``.
+
+        The number of spins in each direction is stored in the integer
+        attributes ``self.nx`` and ``self.ny``, which are cheaper to access.
+        """
+        return (self.nx, self.ny)
+
+    @property
+    def array(self):
+        """Spins as an array with shape ``(nx, ny, 3)``.
+
+        This is a view of ``self.components``, not a copy. Assigning a new array
+        with shape ``(nx, ny, 3)`` copies its values into the lattice planes.
+        """
+        return np.moveaxis(self.components, 0, -1)
+
+    @array.setter
+    def array(self, value):
+        if np.shape(value) != (self.nx, self.ny, 3):
+            raise ValueError(f"Shape of array must be {(self.nx, self.ny, 3)}, not {np.shape(value)}.")
+        self.components = np.array(np.moveaxis(value, -1, 0), dtype=self.components.dtype, order='C')
+
+    @property
+    def sx(self):
+        """Plane of the x components of the spins, shape ``(nx, ny)``."""
+        return self.components[0]
+
+    @property
+    def sy(self):
+        """Plane of the y components of the spins, shape ``(nx, ny)``."""
+        return self.components[1]
+
+    @property
+    def sz(self):
+        """Plane of the z components of the spins, shape ``(nx, ny)``."""
+        return self.components[2]
+
     @property
     def mean(self):
 
@@ -83,7 +131,7 @@ class Spins:
             return m_c
         """
 
-        return np.mean(self.array, (0,1)) #Reference [2]
+        return np.mean(self.components, (1,2)) #Reference [2]
 
         
 
@@ -112,7 +160,7 @@ class Spins:
         return norms
         """
 
-        return np.sqrt(np.sum(self.array**2, axis=2, keepdims=True)) # Reference [3] for keepdims
+        return np.sqrt(self.sx**2 + self.sy**2 + self.sz**2)[..., np.newaxis]
 
 
 
@@ -120,7 +168,7 @@ class Spins:
     def normalise(self):
         """Normalise the magnitude of all spins to 1.
 
-        This method modifies the `self.array` in place. After calling this method, all spins in the
+        This method modifies the `self.components` in place. After calling this method, all spins in the
         lattice will have a magnitude of 1.
 
         Returns
@@ -128,7 +176,9 @@ class Spins:
         It doesn't return any value, it just modifies the array
         """
 
-        self.array = self.array / abs(self)  # This computation will be failing until you implement __abs__.
+        # Norms computed without a squared (3, nx, ny) temporary, and divided in place
+        norms = np.sqrt(np.einsum('kij,kij->ij', self.components, self.components))
+        np.divide(self.components, norms, out=self.components)
 
 
 
@@ -140,7 +190,7 @@ class Spins:
         spins are normalised to 1.
 
         """
-        self.array = 2 * np.random.random((*self.n, 3)) - 1
+        self.components = (2 * np.random.random((3, self.nx, self.ny)) - 1).astype(self.components.dtype)
         self.normalise()
 
 
@@ -170,10 +220,16 @@ class Spins:
             but doesn't return any value.
 
         """
-        nx, ny = np.meshgrid(range(self.n[0]), range(self.n[1]))
-        Sx_final = self.array[..., 0]
-        Sy_final = self.array[..., 1]
-        Sz_final = self.array[..., 2]
+        import matplotlib.pyplot as plt  # Imported here, so mcsim can be imported without loading matplotlib
+
+        if self._mesh is None:
+            # 'ij' indexing gives (nx, ny) arrays, matching the shape of the spin components
+            self._mesh = np.meshgrid(np.arange(self.nx, dtype=np.float32),
+                                     np.arange(self.ny, dtype=np.float32), indexing='ij')
+        nx, ny = self._mesh
+        Sx_final = self.sx
+        Sy_final = self.sy
+        Sz_final = self.sz
         quiver=plt.quiver(nx, ny, Sx_final, Sy_final, Sz_final, pivot='middle', angles='xy', scale_units='xy', scale=1, cmap='plasma')
         plt.title("2D Lattice spins after appplying Metropolis algorithm")
         plt.colorbar(quiver, ax=plt.gca(), label="$S_z$ Component")
@@ -1,5 +1,7 @@
 import numpy as np
 
+from mcsim import _kernels
+
 
 class System:
     """System object with the spin configuration and necessary parameters.
@@ -12,7 +14,8 @@ class System:
 
     B: Iterable
 
-        External magnetic field, length 3.
+        External magnetic field, length 3. It is stored as a numpy array with
+        the same dtype as the spins.
 
     K: numbers.Real
 
@@ -21,7 +24,8 @@ class System:
     u: Iterable(float)
 
         Uniaxial anisotropy axis, length 3. If ``u`` is not normalised to 1, it
-        will be normalised before the calculation of uniaxial anisotropy energy.
+        will be normalised at initialisation. It is stored as a numpy array with
+        the same dtype as the spins.
 
     J: numbers.Real
 
@@ -37,15 +41,18 @@ class System:
         self.s = s
         self.J = J
         self.D = D
-        self.B = B
+        self.B = np.asarray(B, dtype=s.components.dtype)
         self.K = K
-        self.u = u
+        u = np.asarray(u, dtype=s.components.dtype)
+        self.u = u / np.linalg.norm(u)  #Reference [4]
 
     def energy(self):
         """Total energy of the system.
 
-        The total energy of the system is computed as the sum of all individual
-        energy terms.
+        The total energy of the system is the sum of all individual energy
+        terms. Instead of calling the four methods, which would read the whole
+        lattice four times, all terms are accumulated in a single compiled pass
+        over ``self.s.array`` (``mcsim._kernels.total_energy``).
 
         Returns
         -------
@@ -53,9 +60,67 @@ class System:
 
             Total energy of the system.
 
-        """
+        Unoptimised way
+        ---------------
         return self.zeeman() + self.anisotropy() + self.exchange() + self.dmi()
-    
+
+        """
+        return _kernels.total_energy(self.s.components, self.s.nx, self.s.ny,
+                                     *self._kernel_params())
+
+    def local_energy(self, i, j):
+        """Energy contributions that involve the spin at position (i,j).
+
+        Only the Zeeman and anisotropy terms of s_i,j and the exchange and DMI
+        terms of the (up to 4) bonds between s_i,j and its nearest neighbours
+        are included. When only the spin at (i,j) changes, the difference in
+        ``local_energy(i, j)`` is equal to the difference in ``energy()``, but
+        it costs O(1) instead of O(nx*ny).
+
+        The DMI sign convention follows ``dmi``: the bond between s_i,j and
+        s_i,j+1 contributes D x̂·(s_i,j × s_i,j+1), and the bond between s_i,j
+        and s_i+1,j contributes D ŷ·(s_i,j × s_i+1,j).
+
+        Parameters
+        ----------
+        i: int
+
+            Index of the spin in the first dimension of the lattice.
+
+        j: int
+
+            Index of the spin in the second dimension of the lattice.
+
+        Returns
+        -------
+        float
+
+            Energy of all the terms involving the spin at (i,j).
+
+        Raises
+        ------
+        IndexError
+            If (i,j) is not a position in the lattice.
+
+        """
+        # The kernel does not check bounds, so we do it here.
+        if not (0 <= i < self.s.nx and 0 <= j < self.s.ny):
+            raise IndexError(f"Position {(i, j)} is out of the lattice of size {self.s.n}.")
+
+        return _kernels.local_energy(self.s.components, self.s.nx, self.s.ny, i, j,
+                                     *self._kernel_params())
+
+    def _kernel_params(self):
+        """Parameters ``(B, u, K, J, D)`` in the form expected by ``mcsim._kernels``.
+
+        The kernels receive ``s.nx`` and ``s.ny`` and do not check bounds, so this
+        also checks that ``s.components`` really has shape ``(3, nx, ny)``.
+        """
+        if self.s.components.shape != (3, self.s.nx, self.s.ny):
+            raise ValueError(f"Shape of s.components must be {(3, self.s.nx, self.s.ny)}, "
+                             f"not {self.s.components.shape}.")
+
+        return self.B, self.u, float(self.K), float(self.J), float(self.D)
 
 
     def zeeman(self):
@@ -75,8 +140,8 @@ class System:
 
         Attributes Used
         ---------------
-        self.s.array
-            3D array representing the spins in the lattice (numpy.ndarray)
+        self.s.sx, self.s.sy, self.s.sz
+            2D arrays with the components of the spins in the lattice (numpy.ndarray)
         self.B
             A vector representing the external magnetic field applied (numpy.ndarray)
 
@@ -98,7 +163,8 @@ class System:
         return E_Zeeman
         """
 
-        E_Zeeman = -np.sum(self.s.array * self.B)
+        E_Zeeman = -(self.B[0] * np.sum(self.s.sx) + self.B[1] * np.sum(self.s.sy)
+                     + self.B[2] * np.sum(self.s.sz))
         return E_Zeeman
 
 
@@ -122,8 +188,8 @@ class System:
 
         Attributes used
         ---------------
-        self.s.array
-            3D array representing the spins in the lattice (numpy.ndarray)
+        self.s.sx, self.s.sy, self.s.sz
+            2D arrays with the components of the spins in the lattice (numpy.ndarray)
         self.u 
             Vector representing the preferred direction for magnetisation (numpy.ndarray)
         self.k
@@ -149,10 +215,10 @@ class System:
         return e_a
         """
 
-        if not np.isclose(np.linalg.norm(self.u), 1):  #Reference [4]
-            self.u = self.u / np.linalg.norm(self.u)
-
-        e_a = -self.K * np.sum((np.sum(self.s.array * self.u, axis=2))**2)
+        # s_i,j · u for all spins without (nx, ny, 3) temporaries, and the sum of
+        # its squares as a single dot product.
+        projection = np.einsum('kij,k->ij', self.s.components, self.u).ravel()
+        e_a = -self.K * np.dot(projection, projection)
         return e_a
 
 
@@ -172,14 +238,13 @@ class System:
             two spins
 
         The total exchange energy is obtained by summing up the exchange energies of all 
-        nearest-neighbor pairs in the lattice. In this implementation, the method loops
-        over all spin pairs to compute the sum. In further versions, the exchange energy 
-        calculation will be optimised.
+        nearest-neighbor pairs in the lattice. The scalar products of all horizontal and
+        vertical pairs are computed at once with numpy slices of the component planes.
 
          Attributes used
          ---------------
-         self.s.array
-            3D array representing the spins in the lattice  (numpy.ndarray)
+         self.s.sx, self.s.sy, self.s.sz
+            2D arrays with the components of the spins in the lattice  (numpy.ndarray)
          self.J 
             The exchange coupling constant (float)
            
@@ -189,9 +254,8 @@ class System:
          float
             The total exchange energy of the system
 
-        """
-
-    #We just apply distributive property
+        Unoptimised way
+        ---------------
         E_ex = 0
         for i in range(self.s.n[0]):
             for j in range(self.s.n[1]-1):
@@ -204,6 +268,14 @@ class System:
                 E_ex = E_ex - second_part * self.J
 
         return E_ex
+        """
+
+        sx, sy, sz = self.s.sx, self.s.sy, self.s.sz
+        first_part = np.sum(sx[:, :-1] * sx[:, 1:] + sy[:, :-1] * sy[:, 1:] + sz[:, :-1] * sz[:, 1:])
+        second_part = np.sum(sx[:-1, :] * sx[1:, :] + sy[:-1, :] * sy[1:, :] + sz[:-1, :] * sz[1:, :])
+
+        E_ex = -self.J * (first_part + second_part)
+        return E_ex
         
 
     
@@ -219,8 +291,8 @@ class System:
 
         Attributes Used
         ---------------
-        self.s.array 
-            A 3D array representing the spins in the lattice (numpy.ndarray)
+        self.s.sx, self.s.sy, self.s.sz
+            2D arrays with the components of the spins in the lattice (numpy.ndarray)
         self.D 
                 The DMI constant (float)
 
@@ -249,14 +321,13 @@ class System:
         return -self.D*(res1 + res2)   
         """
         
-        r_ij_x = np.array([1, 0, 0]) 
-        r_ij_y = np.array([0, 1, 0])  
-
-        first_cross_product = np.cross(self.s.array[:, :-1, :], self.s.array[:, 1:, :])
-        second_cross_product = np.cross(self.s.array[:-1, :, :], self.s.array[1:, :, :])
+        # x̂·(s_i,j × s_i,j+1) and ŷ·(s_i,j × s_i+1,j) written out with the component
+        # planes, so no (nx, ny, 3) cross product arrays are created.
+        sx, sy, sz = self.s.sx, self.s.sy, self.s.sz
+        first_triple_product = sy[:, :-1] * sz[:, 1:] - sz[:, :-1] * sy[:, 1:]
+        second_triple_product = sz[:-1, :] * sx[1:, :] - sx[:-1, :] * sz[1:, :]
 
-        result1 = -np.sum(r_ij_x * first_cross_product)
-        result2 = -np.sum(r_ij_y * second_cross_product)
+        result1 = -np.sum(first_triple_product)
+        result2 = -np.sum(second_triple_product)
 
         return -self.D * (result1 + result2)
-      
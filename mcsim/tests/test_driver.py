@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import mcsim
 
@@ -63,3 +64,70 @@ class TestIndividualEnergies:
 
         assert np.allclose(system.s.array, system.s.mean, rtol=rtol, atol=atol)
         assert np.allclose(abs(system.s), 1, rtol=rtol, atol=0.1)
+
+
+class TestEnergyTrace:
+    def test_energy_trace(self):
+        n = (6, 5)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+
+        system = mcsim.System(s=s, B=(0, 0, 0.1), K=0.01, u=(0, 0, 1), J=0.5, D=0.5)
+        E_0 = system.energy()
+
+        driver = mcsim.Driver()
+        assert driver.drive(system, n=300) is None
+
+        trace = driver.drive(system, n=300, return_energy_trace=True)
+
+        assert trace.shape == (10,)
+        assert np.all(np.diff(trace) <= 0)  # T=0, so the energy never increases
+        assert trace[0] <= E_0
+        assert np.isclose(trace[-1], system.energy(), rtol=1e-4)
+
+
+class TestSeed:
+    def test_seed_reproducible(self):
+        n = (8, 7)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+        initial = s.array.copy()
+
+        results = []
+        for _ in range(2):
+            s.array = initial
+            system = mcsim.System(s=s, B=(0, 0, 0.1), K=0.01, u=(0, 0, 1), J=0.5, D=0.5)
+            mcsim.Driver(seed=42).drive(system, n=1000)
+            results.append(system.s.array.copy())
+
+        assert np.array_equal(results[0], results[1])
+
+
+class TestBackend:
+    def test_backend_wrong(self):
+        with pytest.raises(ValueError):
+            mcsim.Driver(backend='gpu')
+
+    def test_backend_cuda(self):
+        cuda = pytest.importorskip("numba.cuda")
+        if not cuda.is_available():
+            pytest.skip("CUDA is not available.")
+
+        n = (20, 20)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+
+        B = (1, 0, 0)
+        K = 0
+        u = (0, 1, 0)
+        J = 0
+        D = 0
+
+        system = mcsim.System(s=s, B=B, K=K, u=u, J=J, D=D)
+
+        driver = mcsim.Driver(backend='cuda')
+        trace = driver.drive(system, n=200_000, return_energy_trace=True)
+
+        assert np.allclose(system.s.mean, (1, 0, 0), rtol=rtol, atol=atol)
+        assert np.allclose(abs(system.s), 1, rtol=rtol, atol=atol)
+        assert np.isclose(trace[-1], system.energy(), rtol=1e-4)
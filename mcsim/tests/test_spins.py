@@ -15,6 +15,14 @@ class TestInitialisation:
         assert s.array.shape == (*n, 3)
         assert np.allclose(s.array, value)
 
+    def test_init_dtype(self):
+        n = (4, 3)
+        assert mcsim.Spins(n=n).array.dtype == np.float32
+
+        s = mcsim.Spins(n=n, dtype=np.float64)
+        s.randomise()
+        assert s.array.dtype == np.float64
+
     def test_init_wrong_n(self):
         n = (12, 0)
         value = (1, 0, 0)
@@ -28,6 +36,25 @@ class TestInitialisation:
             s = mcsim.Spins(n=n, value=value)
 
 
+class TestComponents:
+    def test_components_view(self):
+        n = (4, 5)
+        s = mcsim.Spins(n=n)
+
+        assert s.components.shape == (3, *n)
+        assert s.sx.shape == n
+
+        # Writing to array modifies the component planes.
+        s.array[1, 2] = (1, 0, 0)
+        assert np.allclose((s.sx[1, 2], s.sy[1, 2], s.sz[1, 2]), (1, 0, 0))
+        assert np.allclose(s.sz.sum(), n[0] * n[1] - 1)
+
+    def test_array_wrong_shape(self):
+        s = mcsim.Spins(n=(4, 5))
+        with pytest.raises(ValueError):
+            s.array = np.ones((3, 3, 3))
+
+
 class TestRandomise:
     def test_randomise_component_values(self):
         n = (25, 25)
@@ -1,6 +1,7 @@
 import numbers
 
 import numpy as np
+import pytest
 
 import mcsim
 
@@ -221,3 +222,64 @@ class TestDMI:
         system = mcsim.System(s=s, B=B, K=K, u=u, J=J, D=D)
 
         assert np.isclose(system.dmi(), 5)
+
+
+class TestLocalEnergy:
+    def test_local_energy_difference(self):
+        n = (6, 7)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+
+        B = (0.3, -0.2, 1)
+        K = 0.5
+        u = (0, 1, 1)
+        J = 0.6
+        D = 0.7
+
+        system = mcsim.System(s=s, B=B, K=K, u=u, J=J, D=D)
+
+        # Interior, edge and corner sites.
+        for i, j in [(2, 3), (0, 4), (5, 0), (0, 0), (5, 6)]:
+            E_0, E_0_local = system.energy(), system.local_energy(i, j)
+            system.s.array[i, j] = (1, 0, 0)
+            E_1, E_1_local = system.energy(), system.local_energy(i, j)
+
+            assert np.isclose(E_1 - E_0, E_1_local - E_0_local)
+
+    def test_local_energy_out_of_lattice(self):
+        s = mcsim.Spins(n=(6, 7))
+        system = mcsim.System(s=s, B=(0, 0, 1), K=0.5, u=(0, 0, 1), J=0.6, D=0.7)
+
+        for i, j in [(6, 0), (100, 0), (-1, 0), (0, 7)]:
+            with pytest.raises(IndexError):
+                system.local_energy(i, j)
+
+
+class TestShapeCheck:
+    def test_components_wrong_shape(self):
+        s = mcsim.Spins(n=(50, 50))
+        system = mcsim.System(s=s, B=(0, 0, 1), K=0.5, u=(0, 0, 1), J=0.6, D=0.7)
+        s.components = np.ones((3, 3, 3), dtype=np.float32)
+
+        with pytest.raises(ValueError):
+            system.energy()
+        with pytest.raises(ValueError):
+            mcsim.Driver().drive(system, n=100)
+
+
+class TestEnergy:
+    def test_energy_sum(self):
+        n = (9, 7)
+        s = mcsim.Spins(n=n)
+        s.randomise()
+
+        B = (0.3, -0.2, 1)
+        K = 0.5
+        u = (0, 1, 1)
+        J = 0.6
+        D = 0.7
+
+        system = mcsim.System(s=s, B=B, K=K, u=u, J=J, D=D)
+
+        expected = system.zeeman() + system.anisotropy() + system.exchange() + system.dmi()
+        assert np.isclose(system.energy(), expected)